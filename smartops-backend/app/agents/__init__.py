@@ -34,7 +34,7 @@ class BaseAgent(ABC, Generic[InputType, OutputType]):
         Run the agent and track execution time.
         Returns (output, duration_ms)
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         output = self.process(input_data)
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter() - start_time) * 1000
         return output, duration_ms
@@ -16,14 +16,56 @@ class EvaluateAgent(BaseAgent[EvaluateInput, EvaluateOutput]):
     MIN_TASK_COUNT = 0  # Allow 0 tasks (empty is valid)
     MAX_PRIORITY_SCORE = 100
     MIN_PRIORITY_SCORE = 0
-    
+
+    # Memoization cache size (evaluation is deterministic, so identical
+    # inputs - e.g. during orchestrator retries - can reuse the result)
+    CACHE_SIZE = 256
+
     def __init__(self):
         super().__init__(name="EvaluateAgent")
-    
+        self._cache: dict[tuple, EvaluateOutput] = {}
+
     def process(self, input_data: EvaluateInput) -> EvaluateOutput:
         """
         Evaluate the quality of agent outputs.
+        Results are memoized on the features the evaluation reads, so
+        re-evaluating identical outputs is an O(1) lookup.
         """
+        key = self._cache_key(input_data)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        output = self._evaluate(input_data)
+
+        if len(self._cache) >= self.CACHE_SIZE:
+            # Drop the oldest entry (dicts preserve insertion order)
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = output
+
+        return output
+
+    def _cache_key(self, input_data: EvaluateInput) -> tuple:
+        """Build a hashable key from everything the evaluation depends on."""
+        summary = input_data.summary_output
+        extract = input_data.extract_output
+        summary_key = summary and (
+            len(summary.summary),
+            summary.sentence_count,
+            summary.redacted_pii_count
+        )
+        extract_key = extract and (
+            extract.task_count,
+            tuple(
+                (len(t.task.strip()), t.priority_score, t.effort_estimate,
+                 bool(t.owner), bool(t.due_date))
+                for t in extract.tasks
+            )
+        )
+        return (len(input_data.original_text), summary_key, extract_key)
+
+    def _evaluate(self, input_data: EvaluateInput) -> EvaluateOutput:
+        """Compute the evaluation (uncached)."""
         issues = []
         feedback = {}
         quality_score = 1.0  # Start with perfect score
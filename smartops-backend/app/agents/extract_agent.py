@@ -2,11 +2,111 @@
 ExtractAgent: Extracts and prioritizes actionable tasks.
 """
 import re
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 from app.agents import BaseAgent
 from app.models import ExtractInput, ExtractOutput, TaskItem
 
+# Optional speedup: pyahocorasick scans a line for every keyword in one
+# O(len(line)) automaton pass. Falls back to the compiled regexes below.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Precompiled patterns (module-level so they are compiled exactly once,
+# instead of going through re's internal cache lookup on every line)
+_OWNER_RE = re.compile(r'@(\w+)')
+_ISO_DATE_RE = re.compile(r'\b(\d{4}-\d{2}-\d{2})\b')
+_CLEAN_OWNER_RE = re.compile(r'@\w+')
+_CLEAN_DATE_RE = re.compile(r'\b\d{4}-\d{2}-\d{2}\b')
+_WS_RE = re.compile(r'\s+')
+
+# Keyword category flags. Each line is scanned once with _KEYWORD_RE and
+# every hit ORs its category bits into a flag mask; the priority, effort
+# and relative-date helpers then work off the mask instead of re-scanning
+# the line per keyword group.
+_KW_URGENT = 1        # urgency keywords -> +30 priority
+_KW_IMPORTANT = 2     # importance keywords -> +20 priority
+_KW_TOMORROW = 4      # 'tomorrow' -> due date is tomorrow
+_KW_TODAY_EOD = 8     # 'today' / 'eod' -> due date is today, counts as due-soon
+_KW_END_OF_DAY = 16   # 'end of day' -> due date is today (no due-soon bonus,
+                      # matching the old keyword lists)
+_KW_STRONG = 32       # strong action verbs -> +5 priority
+_KW_HIGH_EFFORT = 64  # high-effort keywords
+_KW_LOW_EFFORT = 128  # low-effort keywords
+_KW_ACTIONABLE = 256  # any action verb (word-boundary match)
+
+# Keyword -> category bits. Keywords belonging to several categories
+# (e.g. 'implement' is both a strong verb and high-effort) carry the
+# combined mask, preserving the semantics of the old per-group scans.
+_KEYWORD_MASKS = {
+    'urgent': _KW_URGENT, 'critical': _KW_URGENT, 'asap': _KW_URGENT,
+    'immediately': _KW_URGENT,
+    'important': _KW_IMPORTANT, 'priority': _KW_IMPORTANT, 'high': _KW_IMPORTANT,
+    'tomorrow': _KW_TOMORROW,
+    'today': _KW_TODAY_EOD, 'eod': _KW_TODAY_EOD,
+    'end of day': _KW_END_OF_DAY,
+    'fix': _KW_STRONG, 'deploy': _KW_STRONG, 'complete': _KW_STRONG,
+    'finish': _KW_STRONG, 'submit': _KW_STRONG,
+    'implement': _KW_STRONG | _KW_HIGH_EFFORT,
+    'develop': _KW_HIGH_EFFORT, 'build': _KW_HIGH_EFFORT,
+    'design': _KW_HIGH_EFFORT, 'refactor': _KW_HIGH_EFFORT,
+    'analyze': _KW_HIGH_EFFORT, 'research': _KW_HIGH_EFFORT,
+    'send': _KW_LOW_EFFORT, 'email': _KW_LOW_EFFORT, 'call': _KW_LOW_EFFORT,
+    'review': _KW_LOW_EFFORT, 'update': _KW_LOW_EFFORT,
+    'fix small': _KW_LOW_EFFORT | _KW_STRONG,
+}
+
+# Longest-first alternation so e.g. 'fix small' wins over 'fix'; no \b
+# anchors, keeping the substring semantics of the original `in` checks.
+# IGNORECASE lets the regex path scan the original line without paying
+# for a lowered copy of it.
+_KEYWORD_RE = re.compile('|'.join(
+    sorted(map(re.escape, _KEYWORD_MASKS), key=len, reverse=True)
+), re.IGNORECASE)
+
+
+@dataclass(slots=True)
+class _RawTask:
+    """
+    Lightweight task record for the extraction hot loop. A slots
+    dataclass costs a plain attribute store per field; the validated
+    Pydantic TaskItem is only built once at the output boundary.
+    """
+    task: str
+    owner: Optional[str]
+    due_date: Optional[str]
+    priority_score: int
+    effort_estimate: str
+
+
+def _is_word_char(char: str) -> bool:
+    """Equivalent of regex \\w for the automaton boundary checks."""
+    return char.isalnum() or char == '_'
+
+
+def _make_automaton(action_verbs: list[str]):
+    """
+    Build one Aho-Corasick automaton over the category keywords and the
+    action verbs. Each word maps to (bits, length, needs_boundary) entries;
+    category keywords keep substring semantics, action verbs require word
+    boundaries like the \\b regex they replace.
+    """
+    entries: dict[str, list[tuple[int, int, bool]]] = {}
+    for word, bits in _KEYWORD_MASKS.items():
+        entries.setdefault(word, []).append((bits, len(word), False))
+    for verb in action_verbs:
+        entries.setdefault(verb, []).append((_KW_ACTIONABLE, len(verb), True))
+
+    automaton = ahocorasick.Automaton()
+    for word, values in entries.items():
+        automaton.add_word(word, tuple(values))
+    automaton.make_automaton()
+    return automaton
+
 
 class ExtractAgent(BaseAgent[ExtractInput, ExtractOutput]):
     """
@@ -20,7 +120,15 @@ class ExtractAgent(BaseAgent[ExtractInput, ExtractOutput]):
         'analyze', 'research', 'investigate', 'design', 'build', 'setup',
         'configure', 'install', 'develop', 'refactor', 'optimize'
     ]
-    
+
+    # Single word-boundary alternation over all verbs: one pass per line
+    # instead of up to 31 separate regex searches
+    ACTION_VERBS_RE = re.compile(r'\b(?:' + '|'.join(ACTION_VERBS) + r')\b', re.IGNORECASE)
+
+    # Aho-Corasick automaton over verbs + category keywords (one linear
+    # scan per line for everything), or None when pyahocorasick is absent
+    KEYWORD_AUTOMATON = _make_automaton(ACTION_VERBS) if ahocorasick else None
+
     def __init__(self):
         super().__init__(name="ExtractAgent")
     
@@ -28,117 +136,167 @@ class ExtractAgent(BaseAgent[ExtractInput, ExtractOutput]):
         """
         Extract tasks from input text.
         """
-        text = input_data.text
-        lines = text.strip().split('\n')
-        
-        tasks = []
+        # Pre-split lines shared by the orchestrator, or split here
+        if input_data.lines is not None:
+            lines = input_data.lines
+        else:
+            lines = input_data.text.strip().split('\n')
+
+        # Resolve relative dates once per request instead of calling
+        # datetime.now() (and strftime) for every matching line
+        now = datetime.now()
+        today_str = now.strftime('%Y-%m-%d')
+        tomorrow_str = (now + timedelta(days=1)).strftime('%Y-%m-%d')
+
+        # Accumulate lightweight records in the hot loop; Pydantic
+        # construction is deferred to one pass at the end
+        raw_tasks: list[_RawTask] = []
+
         for line in lines:
             line = line.strip()
             if not line or len(line) < 10:
                 continue
             
-            if not self._is_actionable(line):
+            # One scan collects the actionable bit and all keyword flags;
+            # no helper below allocates its own lowered copy of the line
+            flags = self._scan_line(line)
+            if not flags & _KW_ACTIONABLE:
                 continue
-            
-            # Extract task components
+
+            # Extract task components from the precomputed flags
             owner = self._extract_owner(line)
-            due_date = self._extract_due_date(line)
-            priority_score = self._calculate_priority(line, bool(owner), bool(due_date))
-            effort = self._estimate_effort(line)
+            due_date = self._extract_due_date(line, flags, today_str, tomorrow_str)
+            priority_score = self._calculate_priority(flags, bool(owner), bool(due_date))
+            effort = self._estimate_effort(flags)
             
             # Clean task text
-            task_text = self._clean_task_text(line)
-            
-            tasks.append(TaskItem(
-                task=task_text,
+            raw_tasks.append(_RawTask(
+                task=self._clean_task_text(line),
                 owner=owner,
                 due_date=due_date,
                 priority_score=priority_score,
                 effort_estimate=effort
             ))
-        
-        # Sort by priority descending
-        tasks.sort(key=lambda x: x.priority_score, reverse=True)
-        
-        return ExtractOutput(
+
+        # Sort by priority descending (stable, so insertion order is kept
+        # among equal priorities), then build the output models in one
+        # pass. The fields are produced by our own extractors, so
+        # model_construct safely skips Pydantic's per-field validation.
+        raw_tasks.sort(key=lambda r: r.priority_score, reverse=True)
+        tasks = [
+            TaskItem.model_construct(
+                task=raw.task,
+                owner=raw.owner,
+                due_date=raw.due_date,
+                priority_score=raw.priority_score,
+                effort_estimate=raw.effort_estimate
+            )
+            for raw in raw_tasks
+        ]
+
+        return ExtractOutput.model_construct(
             tasks=tasks,
             task_count=len(tasks)
         )
     
-    def _is_actionable(self, line: str) -> bool:
-        """Check if line contains actionable content."""
-        line_lower = line.lower()
-        for verb in self.ACTION_VERBS:
-            if re.search(rf'\b{verb}\b', line_lower):
-                return True
-        return False
-    
+    def _scan_line(self, line: str) -> int:
+        """
+        Scan a line once and return its keyword flag mask (including
+        _KW_ACTIONABLE). Uses the Aho-Corasick automaton when available,
+        otherwise the compiled regex alternations. The regex path matches
+        case-insensitively on the original line; the automaton is
+        case-sensitive, so that path still lowers the line once.
+        """
+        flags = 0
+
+        if self.KEYWORD_AUTOMATON is not None:
+            line_lower = line.lower()
+            for end, entries in self.KEYWORD_AUTOMATON.iter(line_lower):
+                for bits, length, needs_boundary in entries:
+                    if needs_boundary:
+                        start = end - length + 1
+                        if start > 0 and _is_word_char(line_lower[start - 1]):
+                            continue
+                        if end + 1 < len(line_lower) and _is_word_char(line_lower[end + 1]):
+                            continue
+                    flags |= bits
+            return flags
+
+        # Regex fallback: actionable gate first so non-actionable lines
+        # (the common case) pay for a single scan only
+        if self.ACTION_VERBS_RE.search(line) is None:
+            return 0
+        flags = _KW_ACTIONABLE
+        for match in _KEYWORD_RE.finditer(line):
+            # lower only the short matched token for the mask lookup
+            flags |= _KEYWORD_MASKS[match.group(0).lower()]
+        return flags
+
+
     def _extract_owner(self, line: str) -> Optional[str]:
         """Extract owner from @username."""
-        match = re.search(r'@(\w+)', line)
+        match = _OWNER_RE.search(line)
         return f"@{match.group(1)}" if match else None
     
-    def _extract_due_date(self, line: str) -> Optional[str]:
-        """Extract due date in various formats."""
-        line_lower = line.lower()
-        
-        # ISO date
-        date_match = re.search(r'\b(\d{4}-\d{2}-\d{2})\b', line)
-        if date_match:
-            return date_match.group(1)
-        
-        # Relative dates
-        if 'tomorrow' in line_lower:
-            tomorrow = datetime.now() + timedelta(days=1)
-            return tomorrow.strftime('%Y-%m-%d')
-        
-        if 'eod' in line_lower or 'end of day' in line_lower or 'today' in line_lower:
-            return datetime.now().strftime('%Y-%m-%d')
-        
+    def _extract_due_date(
+        self,
+        line: str,
+        flags: int,
+        today_str: str,
+        tomorrow_str: str
+    ) -> Optional[str]:
+        """Extract due date from an ISO date or the keyword flags."""
+        # ISO date. An ISO date always contains '-', and the C-level
+        # substring check is far cheaper than the regex on the common
+        # hyphen-free line, so use it as a guard.
+        if '-' in line:
+            date_match = _ISO_DATE_RE.search(line)
+            if date_match:
+                return date_match.group(1)
+
+        # Relative dates (resolved once per request by the caller)
+        if flags & _KW_TOMORROW:
+            return tomorrow_str
+
+        if flags & (_KW_TODAY_EOD | _KW_END_OF_DAY):
+            return today_str
+
         return None
-    
-    def _calculate_priority(self, line: str, has_owner: bool, has_due_date: bool) -> int:
-        """Calculate priority score 0-100."""
-        score = 50  # Base
-        line_lower = line.lower()
-        
-        # Urgency keywords
-        if any(word in line_lower for word in ['urgent', 'critical', 'asap', 'immediately']):
-            score += 30
-        elif any(word in line_lower for word in ['important', 'priority', 'high']):
-            score += 20
-        
-        if has_owner:
-            score += 10
-        
-        if has_due_date:
-            score += 15
-            if any(word in line_lower for word in ['today', 'eod', 'tomorrow']):
-                score += 10
-        
-        # Strong action verbs
-        if any(verb in line_lower for verb in ['fix', 'deploy', 'implement', 'complete', 'finish', 'submit']):
-            score += 5
-        
+
+    def _calculate_priority(self, flags: int, has_owner: bool, has_due_date: bool) -> int:
+        """Calculate priority score 0-100 from the keyword flags."""
+        urgent = (flags & _KW_URGENT) != 0
+        important = (flags & _KW_IMPORTANT) != 0
+        due_soon = (flags & (_KW_TOMORROW | _KW_TODAY_EOD)) != 0
+        strong = (flags & _KW_STRONG) != 0
+
+        # Branchless: each bonus is its constant times a 0/1 bit test
+        # (urgent beats important; due-soon only counts with a due date)
+        score = (
+            50  # Base
+            + 30 * urgent
+            + 20 * (important & (not urgent))
+            + 10 * has_owner
+            + 15 * has_due_date
+            + 10 * (has_due_date & due_soon)
+            + 5 * strong
+        )
+
         return min(score, 100)
-    
-    def _estimate_effort(self, line: str) -> str:
+
+    def _estimate_effort(self, flags: int) -> str:
         """Estimate effort: low, medium, or high."""
-        line_lower = line.lower()
-        
-        high_effort = ['implement', 'develop', 'build', 'design', 'refactor', 'analyze', 'research']
-        if any(word in line_lower for word in high_effort):
+        if flags & _KW_HIGH_EFFORT:
             return 'high'
-        
-        low_effort = ['send', 'email', 'call', 'review', 'update', 'fix small']
-        if any(word in line_lower for word in low_effort):
+
+        if flags & _KW_LOW_EFFORT:
             return 'low'
-        
+
         return 'medium'
     
     def _clean_task_text(self, line: str) -> str:
         """Remove owner mentions and dates for cleaner display."""
-        text = re.sub(r'@\w+', '', line)
-        text = re.sub(r'\b\d{4}-\d{2}-\d{2}\b', '', text)
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _CLEAN_OWNER_RE.sub('', line)
+        text = _CLEAN_DATE_RE.sub('', text)
+        text = _WS_RE.sub(' ', text).strip()
         return text
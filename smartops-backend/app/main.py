@@ -1,7 +1,11 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import Dict, Any
+from typing import Optional
 
 from app.orchestrator import Orchestrator
 from app.models import RunReport
@@ -25,8 +29,24 @@ app.add_middleware(
 # Initialize orchestrator
 orchestrator = Orchestrator()
 
-# Store latest run report (in-memory for simplicity)
-latest_run_report: Dict[str, Any] = {}
+
+@app.on_event("startup")
+async def configure_executor():
+    """
+    Size the event loop's default executor, which the orchestrator uses
+    (via asyncio.to_thread) to run the agents. Overridable so deployments
+    can tune thread count to their load.
+    """
+    pool_size = int(os.getenv("THREAD_POOL_SIZE", 32))
+    asyncio.get_event_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=pool_size)
+    )
+
+# Store latest run report (in-memory for simplicity). Kept as the model
+# itself; it is only dumped to a dict when /api/run-report is called.
+# Guarded by a lock so concurrent requests can't interleave the update.
+latest_run_report: Optional[RunReport] = None
+report_lock = asyncio.Lock()
 
 
 class TextInput(BaseModel):
@@ -34,6 +54,11 @@ class TextInput(BaseModel):
     num_sentences: int = 5
 
 
+class BatchTextInput(BaseModel):
+    texts: list[str]
+    num_sentences: int = 5
+
+
 class ProcessResponse(BaseModel):
     """Unified response for multi-agent processing"""
     summary: str | None
@@ -62,19 +87,23 @@ async def process_text(input_data: TextInput):
     """
     global latest_run_report
     
-    # Run orchestrator
+    # Run orchestrator (the orchestrator caches repeated inputs, so the
+    # legacy endpoints below only pay for one pipeline run per text)
     run_report: RunReport = await orchestrator.process_text(
         text=input_data.text,
         num_sentences=input_data.num_sentences
     )
     
-    # Store report for timeline endpoint
-    latest_run_report = run_report.model_dump()
-    
-    # Return simplified response
-    return ProcessResponse(
+    # Store report for timeline endpoint (dumped lazily on read)
+    async with report_lock:
+        latest_run_report = run_report
+
+    # Return simplified response. The fields come from our own RunReport,
+    # so model_construct skips a redundant validation pass; FastAPI's
+    # encoder serializes the TaskItem models directly.
+    return ProcessResponse.model_construct(
         summary=run_report.summary,
-        tasks=[task.model_dump() for task in run_report.tasks],
+        tasks=run_report.tasks,
         run_id=run_report.run_id,
         quality_score=run_report.quality_score,
         total_duration_ms=run_report.total_duration_ms,
@@ -82,16 +111,51 @@ async def process_text(input_data: TextInput):
     )
 
 
+@app.post("/api/process-batch", response_model=list[ProcessResponse])
+async def process_batch(input_data: BatchTextInput):
+    """
+    Process multiple texts in one request. The orchestrator batches the
+    agent work, so per-call overhead is paid once per batch instead of
+    once per text.
+    """
+    global latest_run_report
+
+    run_reports = await orchestrator.process_texts(
+        texts=input_data.texts,
+        num_sentences=input_data.num_sentences
+    )
+
+    if run_reports:
+        async with report_lock:
+            latest_run_report = run_reports[-1]
+
+    return [
+        ProcessResponse.model_construct(
+            summary=report.summary,
+            tasks=report.tasks,
+            run_id=report.run_id,
+            quality_score=report.quality_score,
+            total_duration_ms=report.total_duration_ms,
+            retry_count=report.retry_count
+        )
+        for report in run_reports
+    ]
+
+
 @app.get("/api/run-report")
 async def get_run_report():
     """
     Get the latest run report with full agent timeline.
     Used by frontend to display agent execution details.
     """
-    if not latest_run_report:
+    async with report_lock:
+        report = latest_run_report
+
+    if report is None:
         return {"error": "No run report available yet"}
-    
-    return latest_run_report
+
+    # Dump outside the lock; the report itself is never mutated
+    return report.model_dump()
 
 
 # Legacy endpoints for backward compatibility
@@ -14,6 +14,12 @@ class SummarizeInput(BaseModel):
     """Input for SummarizeAgent"""
     text: str = Field(..., description="Raw text to summarize")
     num_sentences: int = Field(default=5, description="Number of sentences in summary")
+    sentences: Optional[List[str]] = Field(
+        None, description="Pre-split sentences (shared by the orchestrator to avoid re-tokenizing)"
+    )
+    pre_redacted_count: Optional[int] = Field(
+        None, description="Set when the orchestrator already redacted PII from the text"
+    )
 
 
 class SummarizeOutput(BaseModel):
@@ -26,6 +32,9 @@ class SummarizeOutput(BaseModel):
 class ExtractInput(BaseModel):
     """Input for ExtractAgent"""
     text: str = Field(..., description="Raw text to extract tasks from")
+    lines: Optional[List[str]] = Field(
+        None, description="Pre-split lines (shared by the orchestrator to avoid re-tokenizing)"
+    )
 
 
 class TaskItem(BaseModel):
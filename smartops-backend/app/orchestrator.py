@@ -1,21 +1,47 @@
 """
 Orchestrator: Coordinates multi-agent pipeline with parallel execution and feedback loop.
 """
+import hashlib
+import os
 import time
-import uuid
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 from app.models import (
     SummarizeInput, ExtractInput, EvaluateInput,
     SummarizeOutput, ExtractOutput, EvaluateOutput,
     RunReport, AgentRunMetrics, TaskItem
 )
-from app.agents.summarize_agent import SummarizeAgent
+from app.agents.summarize_agent import SummarizeAgent, split_sentences, redact_pii
 from app.agents.extract_agent import ExtractAgent
 from app.agents.evaluate_agent import EvaluateAgent
 
 
+# Per-process agent singletons for the process-pool workers (created
+# lazily in each worker process, since agents don't need to be pickled)
+_worker_summarize_agent: Optional[SummarizeAgent] = None
+_worker_extract_agent: Optional[ExtractAgent] = None
+
+
+def _summarize_worker(payload: dict) -> tuple[dict, float]:
+    """Run SummarizeAgent in a pool worker. Takes/returns plain dicts so
+    only small payloads cross the process boundary."""
+    global _worker_summarize_agent
+    if _worker_summarize_agent is None:
+        _worker_summarize_agent = SummarizeAgent()
+    output, duration_ms = _worker_summarize_agent.run(SummarizeInput(**payload))
+    return output.model_dump(), duration_ms
+
+
+def _extract_worker(payload: dict) -> tuple[dict, float]:
+    """Run ExtractAgent in a pool worker (see _summarize_worker)."""
+    global _worker_extract_agent
+    if _worker_extract_agent is None:
+        _worker_extract_agent = ExtractAgent()
+    output, duration_ms = _worker_extract_agent.run(ExtractInput(**payload))
+    return output.model_dump(), duration_ms
+
+
 class Orchestrator:
     """
     Orchestrates the multi-agent pipeline:
@@ -26,23 +52,217 @@ class Orchestrator:
     """
     
     MAX_RETRIES = 1  # Maximum retry attempts
-    
+
+    # Exact-match result cache: a repeated (text, num_sentences) within
+    # the TTL returns the prior RunReport without running any agent.
+    # Keyed by a blake2b digest of the input so the cache holds no copy
+    # of the text itself.
+    CACHE_TTL = 30.0  # seconds
+    CACHE_SIZE = 64
+
     def __init__(self):
         self.summarize_agent = SummarizeAgent()
         self.extract_agent = ExtractAgent()
         self.evaluate_agent = EvaluateAgent()
-        self.executor = ThreadPoolExecutor(max_workers=2)
-    
+        # The agents are pure-CPU regex work that holds the GIL, so threads
+        # give concurrency but not parallelism. Setting SMARTOPS_PROCESS_POOL=1
+        # routes them through a process pool for true parallelism; the default
+        # stays on threads because pickling costs more than the agents save
+        # on typical (small) inputs.
+        if os.getenv('SMARTOPS_PROCESS_POOL', '').lower() in ('1', 'true', 'yes'):
+            self.process_pool: Optional[ProcessPoolExecutor] = ProcessPoolExecutor(max_workers=2)
+        else:
+            self.process_pool = None
+        self._report_cache: dict[bytes, tuple[float, RunReport]] = {}
+        self._cache_lock = asyncio.Lock()
+        # Specialize once at construction: with retries disabled there is
+        # nothing for the retry loop or the speculation machinery to do,
+        # so bind the straight-line pipeline instead of branching on
+        # every request
+        if self.MAX_RETRIES == 0:
+            self._run_pipeline = self._run_pipeline_no_retry
+
+    @staticmethod
+    def _cache_key(text: str, num_sentences: int) -> bytes:
+        digest = hashlib.blake2b(text.encode(), digest_size=16)
+        digest.update(num_sentences.to_bytes(4, 'little'))
+        return digest.digest()
+
     async def process_text(
         self,
         text: str,
         num_sentences: int = 5
     ) -> RunReport:
         """
-        Process text through the multi-agent pipeline.
+        Process text through the multi-agent pipeline, with a short-TTL
+        exact-match cache so repeated inputs skip the pipeline entirely.
         Returns a complete run report with timeline and metrics.
         """
-        run_id = str(uuid.uuid4())
+        key = self._cache_key(text, num_sentences)
+        now = time.monotonic()
+
+        async with self._cache_lock:
+            cached = self._report_cache.get(key)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+
+        report = await self._run_pipeline(text, num_sentences)
+
+        async with self._cache_lock:
+            if len(self._report_cache) >= self.CACHE_SIZE:
+                # Drop the oldest entry (dicts preserve insertion order)
+                self._report_cache.pop(next(iter(self._report_cache)))
+            self._report_cache[key] = (now + self.CACHE_TTL, report)
+
+        return report
+
+    async def _run_pipeline_no_retry(
+        self,
+        text: str,
+        num_sentences: int
+    ) -> RunReport:
+        """
+        Straight-line variant of _run_pipeline bound when MAX_RETRIES
+        is 0: one parallel phase, one evaluation, no retry loop or
+        speculative attempt.
+        """
+        start_timestamp = time.time()
+
+        report = RunReport(
+            run_id=os.urandom(16).hex(),
+            timestamp=start_timestamp,
+            input_text_length=len(text)
+        )
+
+        redacted_text, pii_count = redact_pii(text)
+        sentences = split_sentences(redacted_text)
+        lines = redacted_text.strip().split('\n')
+
+        summary_output, extract_output, parallel_metrics = await self._run_parallel_agents(
+            redacted_text, num_sentences, sentences, lines, pii_count, attempt=1
+        )
+        report.agent_timeline.extend(parallel_metrics)
+
+        evaluate_output, evaluate_metrics = await self._run_evaluate_agent(
+            text, summary_output, extract_output, attempt=1
+        )
+        report.agent_timeline.append(evaluate_metrics)
+
+        report.summary = summary_output.summary if summary_output else None
+        report.tasks = extract_output.tasks if extract_output else []
+        report.quality_score = evaluate_output.quality_score
+        report.feedback = evaluate_output.feedback
+        report.total_duration_ms = (time.time() - start_timestamp) * 1000
+
+        return report
+
+    async def process_texts(
+        self,
+        texts: list[str],
+        num_sentences: int = 5
+    ) -> list[RunReport]:
+        """
+        Process a batch of texts, amortizing per-call overhead: the
+        summarize and extract agents are each dispatched to the executor
+        once for the whole batch instead of once per document. Cached
+        documents are served from the result cache and only the misses
+        are run. The agents are deterministic, so a retry could never
+        change a result; the batch path therefore runs a single attempt
+        per document.
+        """
+        now = time.monotonic()
+        keys = [self._cache_key(text, num_sentences) for text in texts]
+        reports: list[Optional[RunReport]] = [None] * len(texts)
+
+        async with self._cache_lock:
+            for i, key in enumerate(keys):
+                cached = self._report_cache.get(key)
+                if cached is not None and cached[0] > now:
+                    reports[i] = cached[1]
+
+        miss_indices = [i for i, report in enumerate(reports) if report is None]
+        if not miss_indices:
+            return reports
+
+        # Tokenize the misses once, then one executor dispatch per agent
+        # for the whole batch
+        loop = asyncio.get_event_loop()
+        summarize_inputs = []
+        extract_inputs = []
+        for i in miss_indices:
+            redacted_text, pii_count = redact_pii(texts[i])
+            summarize_inputs.append(SummarizeInput(
+                text=redacted_text,
+                num_sentences=num_sentences,
+                sentences=split_sentences(redacted_text),
+                pre_redacted_count=pii_count
+            ))
+            extract_inputs.append(ExtractInput(
+                text=redacted_text,
+                lines=redacted_text.strip().split('\n')
+            ))
+
+        start_timestamp = time.time()
+        summary_results, extract_results = await asyncio.gather(
+            loop.run_in_executor(None, self._summarize_batch, summarize_inputs),
+            loop.run_in_executor(None, self._extract_batch, extract_inputs)
+        )
+
+        for batch_pos, i in enumerate(miss_indices):
+            summary_output, summary_metrics = summary_results[batch_pos]
+            extract_output, extract_metrics = extract_results[batch_pos]
+
+            report = RunReport(
+                run_id=os.urandom(16).hex(),
+                timestamp=start_timestamp,
+                input_text_length=len(texts[i])
+            )
+            report.agent_timeline.extend([summary_metrics, extract_metrics])
+
+            evaluate_output, evaluate_metrics = await self._run_evaluate_agent(
+                texts[i], summary_output, extract_output, attempt=1
+            )
+            report.agent_timeline.append(evaluate_metrics)
+
+            report.summary = summary_output.summary if summary_output else None
+            report.tasks = extract_output.tasks if extract_output else []
+            report.quality_score = evaluate_output.quality_score
+            report.feedback = evaluate_output.feedback
+            report.total_duration_ms = (time.time() - start_timestamp) * 1000
+            report.success = True
+            reports[i] = report
+
+        async with self._cache_lock:
+            for i in miss_indices:
+                if len(self._report_cache) >= self.CACHE_SIZE:
+                    self._report_cache.pop(next(iter(self._report_cache)))
+                self._report_cache[keys[i]] = (now + self.CACHE_TTL, reports[i])
+
+        return reports
+
+    def _summarize_batch(
+        self,
+        inputs: list[SummarizeInput]
+    ) -> list[tuple[SummarizeOutput, AgentRunMetrics]]:
+        """Run SummarizeAgent over a batch inside one executor task."""
+        return [self._run_summarize_with_metrics(inp, attempt=1) for inp in inputs]
+
+    def _extract_batch(
+        self,
+        inputs: list[ExtractInput]
+    ) -> list[tuple[ExtractOutput, AgentRunMetrics]]:
+        """Run ExtractAgent over a batch inside one executor task."""
+        return [self._run_extract_with_metrics(inp, attempt=1) for inp in inputs]
+
+    async def _run_pipeline(
+        self,
+        text: str,
+        num_sentences: int
+    ) -> RunReport:
+        """Run the full multi-agent pipeline (uncached)."""
+        # 128 random bits like uuid4, without the UUID object and
+        # formatting overhead; this id is only a correlation token
+        run_id = os.urandom(16).hex()
         start_timestamp = time.time()
         
         # Initialize report
@@ -52,26 +272,51 @@ class Orchestrator:
             input_text_length=len(text)
         )
         
+        # Redact PII and tokenize once, shared across both agents (and
+        # across retries): SummarizeAgent needs sentences, ExtractAgent
+        # needs lines, and both see the same redacted text
+        redacted_text, pii_count = redact_pii(text)
+        sentences = split_sentences(redacted_text)
+        lines = redacted_text.strip().split('\n')
+
         attempt = 1
         retry_needed = False
-        
+        speculative: Optional[asyncio.Task] = None
+
         while attempt <= self.MAX_RETRIES + 1:
-            # Step 1: Run summarize and extract in parallel
-            summary_output, extract_output, parallel_metrics = await self._run_parallel_agents(
-                text, num_sentences, attempt
-            )
-            
+            # Step 1: Run summarize and extract in parallel (or adopt the
+            # speculative run started while the previous attempt was
+            # being evaluated)
+            if speculative is not None:
+                summary_output, extract_output, parallel_metrics = await speculative
+                speculative = None
+            else:
+                summary_output, extract_output, parallel_metrics = await self._run_parallel_agents(
+                    redacted_text, num_sentences, sentences, lines, pii_count, attempt
+                )
+
             # Add parallel metrics to timeline
             report.agent_timeline.extend(parallel_metrics)
-            
+
+            # Speculatively start the next attempt's parallel agents
+            # before evaluating this one: if the evaluation asks for a
+            # retry, that work is already in flight. The sleep(0) lets
+            # the task dispatch its executor work so the agent threads
+            # overlap with the (CPU-bound) evaluation below.
+            if attempt <= self.MAX_RETRIES:
+                speculative = asyncio.create_task(self._run_parallel_agents(
+                    redacted_text, num_sentences, sentences, lines, pii_count, attempt + 1
+                ))
+                await asyncio.sleep(0)
+
             # Step 2: Evaluate results
             evaluate_output, evaluate_metrics = await self._run_evaluate_agent(
                 text, summary_output, extract_output, attempt
             )
-            
+
             # Add evaluate metrics to timeline
             report.agent_timeline.append(evaluate_metrics)
-            
+
             # Check if retry is needed
             if evaluate_output.needs_retry and attempt <= self.MAX_RETRIES:
                 retry_needed = True
@@ -79,6 +324,12 @@ class Orchestrator:
                 attempt += 1
                 continue
             else:
+                if speculative is not None:
+                    # No retry: discard the speculation. The executor
+                    # threads it spawned can't be interrupted, but their
+                    # results are simply dropped.
+                    speculative.cancel()
+                    speculative = None
                 # Success or max retries reached
                 report.summary = summary_output.summary if summary_output else None
                 report.tasks = extract_output.tasks if extract_output else []
@@ -96,37 +347,55 @@ class Orchestrator:
         self,
         text: str,
         num_sentences: int,
+        sentences: list[str],
+        lines: list[str],
+        pii_count: int,
         attempt: int
     ) -> tuple[Optional[SummarizeOutput], Optional[ExtractOutput], list[AgentRunMetrics]]:
         """
-        Run SummarizeAgent and ExtractAgent in parallel using ThreadPoolExecutor.
-        Returns (summary_output, extract_output, metrics_list)
+        Run SummarizeAgent and ExtractAgent in parallel.
+        Expects text/sentences/lines already redacted and tokenized by
+        the caller. Returns (summary_output, extract_output, metrics_list)
         """
         loop = asyncio.get_event_loop()
-        
-        # Prepare inputs
-        summarize_input = SummarizeInput(text=text, num_sentences=num_sentences)
-        extract_input = ExtractInput(text=text)
+
+        # Prepare inputs (redacted and pre-tokenized once by the caller)
+        summarize_input = SummarizeInput(
+            text=text, num_sentences=num_sentences, sentences=sentences,
+            pre_redacted_count=pii_count
+        )
+        extract_input = ExtractInput(text=text, lines=lines)
         
         # Run agents in parallel
         start_time = time.time()
         
         try:
             # Execute both agents concurrently
-            summary_future = loop.run_in_executor(
-                self.executor,
-                self._run_summarize_with_metrics,
-                summarize_input,
-                attempt
-            )
-            
-            extract_future = loop.run_in_executor(
-                self.executor,
-                self._run_extract_with_metrics,
-                extract_input,
-                attempt
-            )
-            
+            if self.process_pool is not None:
+                summary_future = self._run_summarize_in_pool(loop, summarize_input, attempt)
+                extract_future = self._run_extract_in_pool(loop, extract_input, attempt)
+            else:
+                # The event loop's default executor (sized at app startup)
+                # replaces the old private 2-worker pool, so parallelism
+                # scales with load instead of being capped at 2 threads
+                # shared across all requests. run_in_executor(None, ...)
+                # rather than asyncio.to_thread: the agents don't read
+                # contextvars, so we skip to_thread's copy_context() +
+                # ctx.run + functools.partial wrapping on every dispatch.
+                summary_future = loop.run_in_executor(
+                    None,
+                    self._run_summarize_with_metrics,
+                    summarize_input,
+                    attempt
+                )
+
+                extract_future = loop.run_in_executor(
+                    None,
+                    self._run_extract_with_metrics,
+                    extract_input,
+                    attempt
+                )
+
             # Wait for both to complete
             summary_result, extract_result = await asyncio.gather(
                 summary_future,
@@ -165,57 +434,91 @@ class Orchestrator:
         input_data: SummarizeInput,
         attempt: int
     ) -> tuple[SummarizeOutput, AgentRunMetrics]:
-        """Run SummarizeAgent and capture metrics."""
+        """
+        Run SummarizeAgent and capture metrics. Exceptions propagate
+        naked: _run_parallel_agents gathers with return_exceptions=True
+        and synthesizes the error metrics there, so building (and
+        discarding) them here as well was pure dead work.
+        """
         start_time = time.time()
-        
-        try:
-            output, duration_ms = self.summarize_agent.run(input_data)
-            
-            metrics = AgentRunMetrics(
-                agent_name="SummarizeAgent",
-                status="success",
-                start_time=start_time,
-                end_time=time.time(),
-                duration_ms=duration_ms,
-                attempt=attempt
-            )
-            
-            return output, metrics
-        
-        except Exception as e:
-            metrics = self._create_error_metrics(
-                "SummarizeAgent", start_time, attempt, str(e)
-            )
-            raise
+        output, duration_ms = self.summarize_agent.run(input_data)
+
+        metrics = AgentRunMetrics(
+            agent_name="SummarizeAgent",
+            status="success",
+            start_time=start_time,
+            # Wall-clock end for the frontend timeline; the precise
+            # duration comes from the agent's own perf_counter timing
+            end_time=start_time + duration_ms / 1000,
+            duration_ms=duration_ms,
+            attempt=attempt
+        )
+
+        return output, metrics
     
     def _run_extract_with_metrics(
         self,
         input_data: ExtractInput,
         attempt: int
     ) -> tuple[ExtractOutput, AgentRunMetrics]:
-        """Run ExtractAgent and capture metrics."""
+        """Run ExtractAgent and capture metrics (see the summarize
+        variant for why exceptions propagate naked)."""
         start_time = time.time()
-        
-        try:
-            output, duration_ms = self.extract_agent.run(input_data)
-            
-            metrics = AgentRunMetrics(
-                agent_name="ExtractAgent",
-                status="success",
-                start_time=start_time,
-                end_time=time.time(),
-                duration_ms=duration_ms,
-                attempt=attempt
-            )
-            
-            return output, metrics
-        
-        except Exception as e:
-            metrics = self._create_error_metrics(
-                "ExtractAgent", start_time, attempt, str(e)
-            )
-            raise
+        output, duration_ms = self.extract_agent.run(input_data)
+
+        metrics = AgentRunMetrics(
+            agent_name="ExtractAgent",
+            status="success",
+            start_time=start_time,
+            end_time=start_time + duration_ms / 1000,
+            duration_ms=duration_ms,
+            attempt=attempt
+        )
+
+        return output, metrics
     
+    async def _run_summarize_in_pool(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        input_data: SummarizeInput,
+        attempt: int
+    ) -> tuple[SummarizeOutput, AgentRunMetrics]:
+        """Run SummarizeAgent in the process pool and capture metrics."""
+        start_time = time.time()
+        output_dict, duration_ms = await loop.run_in_executor(
+            self.process_pool, _summarize_worker, input_data.model_dump()
+        )
+        metrics = AgentRunMetrics(
+            agent_name="SummarizeAgent",
+            status="success",
+            start_time=start_time,
+            end_time=time.time(),
+            duration_ms=duration_ms,
+            attempt=attempt
+        )
+        return SummarizeOutput(**output_dict), metrics
+
+    async def _run_extract_in_pool(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        input_data: ExtractInput,
+        attempt: int
+    ) -> tuple[ExtractOutput, AgentRunMetrics]:
+        """Run ExtractAgent in the process pool and capture metrics."""
+        start_time = time.time()
+        output_dict, duration_ms = await loop.run_in_executor(
+            self.process_pool, _extract_worker, input_data.model_dump()
+        )
+        metrics = AgentRunMetrics(
+            agent_name="ExtractAgent",
+            status="success",
+            start_time=start_time,
+            end_time=time.time(),
+            duration_ms=duration_ms,
+            attempt=attempt
+        )
+        return ExtractOutput(**output_dict), metrics
+
     async def _run_evaluate_agent(
         self,
         text: str,
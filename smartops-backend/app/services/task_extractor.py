@@ -1,7 +1,15 @@
 import re
+import string
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
+# Optional speedup: Numba JIT-compiles the priority arithmetic to native
+# code; the keyword scans stay as compiled regexes in the caller
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 
 # Action verbs that indicate tasks
 ACTION_VERBS = [
@@ -12,13 +20,154 @@ ACTION_VERBS = [
     'configure', 'install', 'develop', 'refactor', 'optimize'
 ]
 
+# Precompiled patterns (module-level so they are compiled exactly once,
+# instead of going through re's internal cache lookup on every line).
+# is_actionable_line previously even built a fresh f-string pattern per
+# verb per line; the per-verb patterns are now compiled at import.
+_OWNER_RE = re.compile(r'@(\w+)')
+_DATE_RE = re.compile(r'\b(\d{4}-\d{2}-\d{2})\b')
+_MENTION_RE = re.compile(r'@\w+')
+_WS_RE = re.compile(r'\s+')
+
+# Combined owner/date pattern for the extraction loop: one finditer
+# yields both components and one sub removes both in the same traversal,
+# instead of separate search+search+sub+sub passes over each line
+_EXTRACT_RE = re.compile(r'@(?P<owner>\w+)|\b(?P<date>\d{4}-\d{2}-\d{2})\b')
+_IMPERATIVE_RE = re.compile(r'^[A-Z][a-z]+\s+')
+
+# O(1) verb membership for is_actionable_line: tokenize and test against
+# a frozenset instead of running a 31-branch alternation over the line.
+# Punctuation (except '_', which regex \b treats as a word character) is
+# translated to spaces first so 'fix,' or 're-fix' still yields the verb
+# as its own token, mirroring the word-boundary semantics of the old
+# regex scan.
+_ACTION_VERB_SET = frozenset(ACTION_VERBS)
+_PUNCT_TABLE = str.maketrans({c: ' ' for c in string.punctuation if c != '_'})
+
+# Keyword category flags: one scan per line (analyze_line) collects all
+# categories into a bitfield, replacing a separate regex pass per group.
+# The priority, effort and relative-date helpers consume the flags.
+_KW_URGENT = 1        # urgency keywords -> +30 priority
+_KW_IMPORTANT = 2     # importance keywords -> +20 priority
+_KW_TOMORROW = 4      # 'tomorrow' -> due date is tomorrow, due-soon
+_KW_TODAY_EOD = 8     # 'today' / 'eod' -> due date is today, due-soon
+_KW_END_OF_DAY = 16   # 'end of day' -> due date is today (no due-soon
+                      # bonus, matching the old keyword lists)
+_KW_STRONG = 32       # strong action verbs -> +5 priority
+_KW_HIGH_EFFORT = 64  # high-effort keywords
+_KW_LOW_EFFORT = 128  # low-effort keywords
+
+# Keyword -> category bits. Keywords in several categories (e.g.
+# 'implement' is both a strong verb and high-effort) carry the combined
+# mask; 'fix small' carries the strong bit because it contains 'fix'.
+_KEYWORD_MASKS = {
+    'urgent': _KW_URGENT, 'critical': _KW_URGENT, 'asap': _KW_URGENT,
+    'immediately': _KW_URGENT,
+    'important': _KW_IMPORTANT, 'priority': _KW_IMPORTANT, 'high': _KW_IMPORTANT,
+    'tomorrow': _KW_TOMORROW,
+    'today': _KW_TODAY_EOD, 'eod': _KW_TODAY_EOD,
+    'end of day': _KW_END_OF_DAY,
+    'fix': _KW_STRONG, 'deploy': _KW_STRONG, 'complete': _KW_STRONG,
+    'finish': _KW_STRONG, 'submit': _KW_STRONG,
+    'implement': _KW_STRONG | _KW_HIGH_EFFORT,
+    'develop': _KW_HIGH_EFFORT, 'build': _KW_HIGH_EFFORT,
+    'design': _KW_HIGH_EFFORT, 'refactor': _KW_HIGH_EFFORT,
+    'analyze': _KW_HIGH_EFFORT, 'research': _KW_HIGH_EFFORT,
+    'send': _KW_LOW_EFFORT, 'email': _KW_LOW_EFFORT, 'call': _KW_LOW_EFFORT,
+    'review': _KW_LOW_EFFORT, 'update': _KW_LOW_EFFORT,
+    'fix small': _KW_LOW_EFFORT | _KW_STRONG,
+}
+
+# Alternation branches ordered by expected corpus frequency (the regex
+# engine tries them in order at each position, so common keywords like
+# 'review'/'update' exit sooner on typical task lines). The only
+# ordering constraint for correctness is that 'fix small' precedes its
+# prefix 'fix'; no other keyword is a prefix of another. No \b anchors,
+# keeping the substring semantics of the old per-group scans. A pure
+# named-group pattern can't express overlapping categories: a 'fix'
+# branch would consume the text before 'fix small' could match.
+_KEYWORD_ORDER = (
+    'review', 'update', 'call', 'email', 'send',
+    'today', 'tomorrow', 'important', 'priority', 'high',
+    'fix small', 'fix', 'complete', 'finish', 'submit', 'deploy',
+    'implement', 'build', 'design', 'develop', 'analyze', 'research', 'refactor',
+    'urgent', 'critical', 'asap', 'immediately', 'eod', 'end of day',
+)
+assert set(_KEYWORD_ORDER) == set(_KEYWORD_MASKS)
+_KEYWORD_RE = re.compile('|'.join(map(re.escape, _KEYWORD_ORDER)))
+
+
+def _priority_kernel(
+    urgent: bool,
+    important: bool,
+    has_owner: bool,
+    has_due_date: bool,
+    due_soon: bool,
+    strong: bool
+) -> int:
+    """Numeric part of calculate_priority_score (JIT-compiled when
+    Numba is present)."""
+    score = 50  # Base score
+
+    if urgent:
+        score += 30
+    elif important:
+        score += 20
+
+    if has_owner:
+        score += 10
+
+    if has_due_date:
+        score += 15
+        if due_soon:
+            score += 10
+
+    if strong:
+        score += 5
+
+    # Cap at 100
+    return score if score < 100 else 100
+
+
+if njit is not None:
+    _priority_kernel = njit(cache=True)(_priority_kernel)
+    _priority_kernel(False, False, False, False, False, False)  # warm-up
+
 
 def extract_owner(line: str) -> Optional[str]:
     """Extract owner from @username mentions."""
-    match = re.search(r'@(\w+)', line)
+    match = _OWNER_RE.search(line)
     return f"@{match.group(1)}" if match else None
 
 
+def analyze_line(line_lower: str) -> int:
+    """
+    Scan an already-lowered line once and return its keyword category
+    bitfield (see the _KW_* flags above).
+    """
+    flags = 0
+    for match in _KEYWORD_RE.finditer(line_lower):
+        flags |= _KEYWORD_MASKS[match.group(0)]
+    return flags
+
+
+def _today_tomorrow() -> tuple[str, str]:
+    """Format today's and tomorrow's dates once (strftime is costly)."""
+    now = datetime.now()
+    return now.strftime('%Y-%m-%d'), (now + timedelta(days=1)).strftime('%Y-%m-%d')
+
+
+def _relative_due_date(flags: int, today_str: str, tomorrow_str: str) -> Optional[str]:
+    """Resolve 'tomorrow' / 'eod' / 'end of day' / 'today' keywords."""
+    if flags & _KW_TOMORROW:
+        return tomorrow_str
+
+    if flags & (_KW_TODAY_EOD | _KW_END_OF_DAY):
+        return today_str
+
+    return None
+
+
 def extract_due_date(line: str) -> Optional[str]:
     """
     Extract due date from various formats:
@@ -27,95 +176,63 @@ def extract_due_date(line: str) -> Optional[str]:
     - EOD (end of day - today)
     - today
     """
-    line_lower = line.lower()
-    
     # Check for YYYY-MM-DD format
-    date_match = re.search(r'\b(\d{4}-\d{2}-\d{2})\b', line)
+    date_match = _DATE_RE.search(line)
     if date_match:
         return date_match.group(1)
-    
+
     # Check for relative dates
-    if 'tomorrow' in line_lower:
-        tomorrow = datetime.now() + timedelta(days=1)
-        return tomorrow.strftime('%Y-%m-%d')
-    
-    if 'eod' in line_lower or 'end of day' in line_lower or 'today' in line_lower:
-        return datetime.now().strftime('%Y-%m-%d')
-    
-    return None
+    return _relative_due_date(analyze_line(line.lower()), *_today_tomorrow())
 
 
-def calculate_priority_score(line: str, has_owner: bool, has_due_date: bool) -> int:
+def calculate_priority_score(flags: int, has_owner: bool, has_due_date: bool) -> int:
     """
     Calculate priority score (0-100) based on various factors.
+    Consumes the keyword flags produced by analyze_line.
     """
-    score = 50  # Base score
-    
-    line_lower = line.lower()
-    
-    # Urgency keywords
-    if any(word in line_lower for word in ['urgent', 'critical', 'asap', 'immediately']):
-        score += 30
-    elif any(word in line_lower for word in ['important', 'priority', 'high']):
-        score += 20
-    
-    # Has owner
-    if has_owner:
-        score += 10
-    
-    # Has due date
-    if has_due_date:
-        score += 15
-        # Check if due date is soon
-        if any(word in line_lower for word in ['today', 'eod', 'tomorrow']):
-            score += 10
-    
-    # Action verb strength
-    strong_verbs = ['fix', 'deploy', 'implement', 'complete', 'finish', 'submit']
-    if any(verb in line_lower for verb in strong_verbs):
-        score += 5
-    
-    # Cap at 100
-    return min(score, 100)
+    # Keyword detection happened in analyze_line; only bit tests here
+    return _priority_kernel(
+        (flags & _KW_URGENT) != 0,
+        (flags & _KW_IMPORTANT) != 0,
+        has_owner,
+        has_due_date,
+        (flags & (_KW_TOMORROW | _KW_TODAY_EOD)) != 0,
+        (flags & _KW_STRONG) != 0
+    )
 
 
-def estimate_effort(line: str) -> str:
+def estimate_effort(flags: int) -> str:
     """
     Estimate effort level based on keywords and complexity indicators.
+    Consumes the keyword flags produced by analyze_line.
     """
-    line_lower = line.lower()
-    
     # High effort indicators
-    high_effort = ['implement', 'develop', 'build', 'design', 'refactor', 'analyze', 'research']
-    if any(word in line_lower for word in high_effort):
+    if flags & _KW_HIGH_EFFORT:
         return 'high'
-    
+
     # Low effort indicators
-    low_effort = ['send', 'email', 'call', 'review', 'update', 'fix small']
-    if any(word in line_lower for word in low_effort):
+    if flags & _KW_LOW_EFFORT:
         return 'low'
-    
+
     # Default to medium
     return 'medium'
 
 
-def is_actionable_line(line: str) -> bool:
+def is_actionable_line(line: str, line_lower: Optional[str] = None) -> bool:
     """
-    Check if a line contains actionable content.
+    Check if a line contains actionable content. Callers that already
+    lowered the line can pass it to skip the extra allocation.
     """
-    line_lower = line.lower()
-    
-    # Check for action verbs
-    for verb in ACTION_VERBS:
-        # Match verb at word boundary (not part of another word)
-        if re.search(rf'\b{verb}\b', line_lower):
-            return True
-    
-    # Check for imperative patterns (commands)
-    if re.match(r'^[A-Z][a-z]+\s+', line):  # Starts with capital letter verb
+    if line_lower is None:
+        line_lower = line.lower()
+
+    # Check for action verbs: set membership on the line's tokens (not
+    # part of another word, as with the old word-boundary regex)
+    if not _ACTION_VERB_SET.isdisjoint(line_lower.translate(_PUNCT_TABLE).split()):
         return True
-    
-    return False
+
+    # Check for imperative patterns (commands)
+    return _IMPERATIVE_RE.match(line) is not None  # Starts with capital letter verb
 
 
 def extract_and_prioritize_tasks(text: str) -> List[Dict]:
@@ -127,35 +244,53 @@ def extract_and_prioritize_tasks(text: str) -> List[Dict]:
     """
     # Split text into lines
     lines = text.strip().split('\n')
-    
+
+    # Resolve relative dates once per call instead of hitting
+    # datetime.now()/strftime for every 'today'/'tomorrow' line
+    today_str, tomorrow_str = _today_tomorrow()
+
     tasks = []
-    
+
     for line in lines:
         line = line.strip()
-        
+
         # Skip empty lines or very short lines
         if not line or len(line) < 10:
             continue
-        
+
+        # Lower once; every helper below reuses this copy
+        line_lower = line.lower()
+
         # Check if line is actionable
-        if not is_actionable_line(line):
+        if not is_actionable_line(line, line_lower):
             continue
-        
-        # Extract task components
-        owner = extract_owner(line)
-        due_date = extract_due_date(line)
-        
+
+        # Extract owner and ISO due date in one scan of the line
+        owner = None
+        due_date = None
+        for match in _EXTRACT_RE.finditer(line):
+            if match.lastgroup == 'owner':
+                if owner is None:
+                    owner = f"@{match.group('owner')}"
+            elif due_date is None:
+                due_date = match.group('date')
+
+        # One keyword scan feeds the date, priority and effort helpers
+        flags = analyze_line(line_lower)
+
+        # No ISO date: fall back to relative-date keywords
+        if due_date is None:
+            due_date = _relative_due_date(flags, today_str, tomorrow_str)
+
         # Calculate priority score
-        priority_score = calculate_priority_score(line, bool(owner), bool(due_date))
-        
+        priority_score = calculate_priority_score(flags, bool(owner), bool(due_date))
+
         # Estimate effort
-        effort = estimate_effort(line)
-        
-        # Clean up the task text (remove owner mentions and dates for cleaner display)
-        task_text = line
-        task_text = re.sub(r'@\w+', '', task_text)  # Remove @mentions
-        task_text = re.sub(r'\b\d{4}-\d{2}-\d{2}\b', '', task_text)  # Remove dates
-        task_text = re.sub(r'\s+', ' ', task_text).strip()  # Clean whitespace
+        effort = estimate_effort(flags)
+
+        # Clean up the task text (remove owner mentions and dates for
+        # cleaner display): one combined sub, then one whitespace pass
+        task_text = _WS_RE.sub(' ', _EXTRACT_RE.sub('', line)).strip()
         
         tasks.append({
             'task': task_text,